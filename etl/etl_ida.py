@@ -27,23 +27,27 @@ Versão: 2.0.0
 """
 
 import os
+import re
 import sys
 import logging
 import hashlib
+import shutil
+import multiprocessing
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, ProcessPoolExecutor, wait
+from datetime import date, datetime
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
-from io import BytesIO
+from io import BytesIO, StringIO
 
 import pandas as pd
 import numpy as np
 import psycopg2
-import re
 from psycopg2.extras import execute_values
-from psycopg2.pool import SimpleConnectionPool
 
 
 # Configuração de logging
@@ -60,6 +64,11 @@ logging.basicConfig(
 log_level = os.environ.get('LOG_LEVEL', 'INFO')
 logging.getLogger().setLevel(getattr(logging, log_level))
 
+# Padrões de mês compilados uma única vez: rótulo exato de coluna de mês
+# (YYYY-MM) e ocorrência de YYYY-MM em qualquer célula do cabeçalho
+_MONTH_RE = re.compile(r'^(20[0-2]\d|2030)-(0[1-9]|1[0-2])$')
+_YEAR_MONTH_RE = re.compile(r'\d{4}-\d{2}')
+
 
 @dataclass
 class ETLConfig:
@@ -67,7 +76,6 @@ class ETLConfig:
     
     Attributes:
         db_connection_string: String de conexão PostgreSQL
-        batch_size: Tamanho do lote para inserção em batch
         max_retries: Número máximo de tentativas em caso de erro
         api_key: Chave de API para dados.gov.br
     """
@@ -76,7 +84,6 @@ class ETLConfig:
     db_name: str = os.environ.get("DB_NAME")
     db_user: str = os.environ.get("DB_USER")
     db_password: str = os.environ.get("DB_PASSWORD")
-    batch_size: int = int(os.environ.get("BATCH_SIZE", "1000"))
     max_retries: int = int(os.environ.get("MAX_RETRIES", "3"))
     api_key: str = os.environ.get("API_KEY", "")
     log_level: str = os.environ.get("LOG_LEVEL", "INFO")
@@ -100,37 +107,6 @@ class RecursoIDA:
     servico: str
 
 
-@dataclass
-class DataRecord:
-    """Registro de dados normalizado para carga no banco.
-    
-    Attributes:
-        ano_mes: Data no formato YYYY-MM-01
-        grupo_economico: Código do grupo econômico
-        servico: Código do serviço (SMP, SCM, STFC)
-        variavel: Código da variável
-        valor: Valor da métrica
-        arquivo_origem: Nome do arquivo de origem
-        linha_origem: Número da linha no arquivo
-    """
-    ano_mes: str
-    grupo_economico: str
-    servico: str
-    variavel: str
-    valor: float
-    arquivo_origem: str
-    linha_origem: int
-    
-    def generate_hash(self) -> str:
-        """Gera hash MD5 único para o registro.
-        
-        Returns:
-            str: Hash MD5 do registro
-        """
-        content = f"{self.ano_mes}|{self.grupo_economico}|{self.servico}|{self.variavel}|{self.valor}"
-        return hashlib.md5(content.encode()).hexdigest()
-
-
 class BaseExtractor(ABC):
     """Classe base abstrata para extratores de dados.
     
@@ -191,6 +167,9 @@ class ODSExtractor(BaseExtractor):
         'Taxa de Respondidas no Período': 'TAXA_RESP_PERIODO'
     }
     
+    # Colunas de identificação das linhas, convertidas para category
+    ID_COLUMNS = ['GRUPO_ECONOMICO', 'VARIAVEL', 'SERVICO', 'ARQUIVO_ORIGEM']
+    
     def extract(self, file_content: BytesIO, metadata: Dict[str, Any]) -> pd.DataFrame:
         """Extrai dados de um arquivo ODS em memória.
         
@@ -211,28 +190,21 @@ class ODSExtractor(BaseExtractor):
         self.logger.info(f"Extraindo dados de {filename} - Sheet: {sheet_name}")
         
         try:
-            # Lê o arquivo sem header para analisar a estrutura
+            # Lê a planilha uma única vez, sem header, para analisar a estrutura
             df_raw = pd.read_excel(
                 file_content,
                 sheet_name=sheet_name,
                 header=None,
-                engine='odf'
+                engine='calamine'
             )
             
-            # Volta ao início do arquivo para próxima leitura
-            file_content.seek(0)
-            
             # Encontra a linha de cabeçalho
             header_row = self._find_header_row(df_raw)
             self.logger.info(f"Linha de cabeçalho encontrada: {header_row}")
             
-            # Lê novamente com o header correto
-            df = pd.read_excel(
-                file_content,
-                sheet_name=sheet_name,
-                header=header_row,
-                engine='odf'
-            )
+            # Promove a linha de cabeçalho a nomes de coluna, sem reler o arquivo
+            df = df_raw.iloc[header_row + 1:].reset_index(drop=True)
+            df.columns = df_raw.iloc[header_row].tolist()
             
             # Renomeia as primeiras colunas
             columns = df.columns.tolist()
@@ -248,6 +220,11 @@ class ODSExtractor(BaseExtractor):
             # Preenche grupos faltantes (repetidos no arquivo)
             df['GRUPO_ECONOMICO'] = df['GRUPO_ECONOMICO'].ffill()
             
+            # Colunas de identificação têm poucos valores distintos: como
+            # category, ocupam menos memória e a limpeza de texto passa a
+            # rodar só sobre as categorias
+            df[self.ID_COLUMNS] = df[self.ID_COLUMNS].astype('category')
+            
             self.logger.info(f"Extraídos {len(df)} registros de {filename}")
             
             return df
@@ -257,18 +234,31 @@ class ODSExtractor(BaseExtractor):
             raise
     
     def _find_header_row(self, df_raw: pd.DataFrame) -> int:
-        """Encontra a linha de cabeçalho no DataFrame."""
-        for idx in range(min(20, len(df_raw))):
-            row_values = df_raw.iloc[idx].astype(str)
-            normalized = [str(v).strip().upper() for v in row_values]
-            
-            # identifica cabeçalho por colunas de texto
-            if any('GRUPO' in v for v in normalized) and any('VARIAVEL' in v for v in normalized):
-                return idx
-            
-            # identifica cabeçalho por padrão YYYY-MM
-            if any(re.search(r'\d{4}-\d{2}', v) for v in normalized):
-                return idx
+        """Encontra a linha de cabeçalho no DataFrame.
+        
+        Analisa as 20 primeiras linhas de uma vez, como um único bloco de
+        strings, e retorna a primeira que contém colunas de texto GRUPO e
+        VARIAVEL ou um rótulo no padrão YYYY-MM.
+        """
+        head = df_raw.head(20)
+        if head.empty:
+            return 8
+        
+        cells = pd.Series(head.astype(str).to_numpy().ravel()).str.strip().str.upper()
+        
+        def any_per_row(mask: pd.Series) -> np.ndarray:
+            return mask.to_numpy().reshape(head.shape).any(axis=1)
+        
+        # identifica cabeçalho por colunas de texto
+        has_grupo = any_per_row(cells.str.contains('GRUPO', regex=False))
+        has_variavel = any_per_row(cells.str.contains('VARIAVEL', regex=False))
+        
+        # identifica cabeçalho por padrão YYYY-MM
+        has_mes = any_per_row(cells.str.contains(_YEAR_MONTH_RE))
+        
+        matches = (has_grupo & has_variavel) | has_mes
+        if matches.any():
+            return int(matches.argmax())
         
         # Valor padrão
         return 8
@@ -281,6 +271,34 @@ class DataTransformer:
     normalizado esperado pelo banco de dados.
     """
     
+    # Padronização dos nomes de grupos econômicos conhecidos
+    GROUP_MAPPING = {
+        'ALGAR TELECOM S/A': 'ALGAR',
+        'CLARO S.A.': 'CLARO',
+        'TELEFÔNICA BRASIL S.A.': 'VIVO',
+        'TIM S.A.': 'TIM',
+        'OI S.A.': 'OI',
+        'NET SERVIÇOS DE COMUNICAÇÃO S.A.': 'NET',
+        'SKY BRASIL SERVIÇOS LTDA.': 'SKY',
+        'EMPRESA BRASILEIRA DE TELECOMUNICAÇÕES S.A. - EMBRATEL': 'EMBRATEL',
+        'NEXTEL TELECOMUNICAÇÕES LTDA.': 'NEXTEL',
+        'SERCOMTEL S.A. TELECOMUNICAÇÕES': 'SERCOMTEL'
+    }
+    
+    # Colunas do DataFrame produzido, na ordem de carga:
+    #   ano_mes: data no formato YYYY-MM-01
+    #   grupo_economico: código do grupo econômico
+    #   servico: código do serviço (SMP, SCM, STFC)
+    #   variavel: código da variável
+    #   valor: valor da métrica
+    #   arquivo_origem: nome do arquivo de origem
+    #   linha_origem: número da linha no arquivo
+    #   hash_registro: hash BLAKE2b (128 bits) de ano_mes|grupo|servico|variavel|valor
+    OUTPUT_COLUMNS = [
+        'ano_mes', 'grupo_economico', 'servico', 'variavel',
+        'valor', 'arquivo_origem', 'linha_origem', 'hash_registro'
+    ]
+    
     def __init__(self, config: ETLConfig):
         """Inicializa o transformador.
         
@@ -290,143 +308,127 @@ class DataTransformer:
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
     
-    def transform(self, df: pd.DataFrame) -> List[DataRecord]:
-        """Transforma DataFrame em lista de registros normalizados.
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transforma DataFrame em registros normalizados.
         
         Args:
             df: DataFrame com dados extraídos
             
         Returns:
-            List[DataRecord]: Lista de registros normalizados
+            pd.DataFrame: Registros normalizados, com as colunas de OUTPUT_COLUMNS
         """
         self.logger.info("Iniciando transformação dos dados")
         self.logger.info(f"Colunas encontradas: {df.columns.tolist()}")
         
-        records = []
-        
-        # Identifica colunas de meses
-        month_columns = [col for col in df.columns if self._is_month_column(col)]
+        # Identifica colunas de meses: rótulos YYYY-MM ou datas
+        labels = df.columns.astype(str).str.strip()
+        is_month_label = labels.str.match(_MONTH_RE)
+        is_date = np.array([isinstance(col, date) for col in df.columns], dtype=bool)
+        month_columns = df.columns[is_month_label | is_date].tolist()
         self.logger.info(f"Colunas de meses identificadas: {len(month_columns)} colunas")
         
         if not month_columns:
             self.logger.error("Nenhuma coluna de mês encontrada!")
-            return records
+            return pd.DataFrame(columns=self.OUTPUT_COLUMNS)
         
-        # Processa cada linha do DataFrame
-        for idx, row in df.iterrows():
-            # Na estrutura real, GRUPO está na primeira coluna e VARIÁVEL na segunda
-            grupo = str(row.iloc[0]) if not pd.isna(row.iloc[0]) else ""
-            variavel = str(row.iloc[1]) if not pd.isna(row.iloc[1]) else ""
-            
-            # Remove 'nan' e espaços
-            grupo = grupo.strip() if grupo != 'nan' else ""
-            variavel = variavel.strip() if variavel != 'nan' else ""
-            
-            # Pula linhas sem grupo ou variável
-            if not grupo or not variavel:
-                continue
-            
-            # Limpa e padroniza o grupo
-            grupo_limpo = self._clean_text(grupo)
-            variavel_limpa = self._clean_text(variavel)
-            
-            # Mapeia variável para código
-            variavel_codigo = ODSExtractor.VARIABLE_MAPPING.get(variavel_limpa, variavel_limpa)
-            
-            # Processa cada mês
-            for month_col in month_columns:
-                try:
-                    valor = row[month_col]
-                    
-                    # Pula valores vazios ou inválidos
-                    if pd.isna(valor) or str(valor).strip() in ['-', '', 'nan']:
-                        continue
-                    
-                    # Converte valor para float
-                    valor_float = self._parse_value(valor)
-                    if valor_float is None:
-                        continue
-                    
-                    # Formata a data corretamente
-                    if hasattr(month_col, 'strftime'):
-                        # É um Timestamp
-                        ano_mes = month_col.strftime('%Y-%m-01')
-                    else:
-                        # É uma string
-                        month_str = str(month_col).strip()
-                        if ' ' in month_str:  # Remove parte da hora se existir
-                            month_str = month_str.split(' ')[0]
-                        ano_mes = f"{month_str}-01"
-                    
-                    # Cria registro normalizado
-                    record = DataRecord(
-                        ano_mes=ano_mes,
-                        grupo_economico=grupo_limpo,
-                        servico=row['SERVICO'],
-                        variavel=variavel_codigo,
-                        valor=valor_float,
-                        arquivo_origem=row['ARQUIVO_ORIGEM'],
-                        linha_origem=idx
-                    )
-                    
-                    records.append(record)
-                    
-                except Exception as e:
-                    self.logger.debug(f"Erro ao processar célula: {str(e)}")
+        # Formata cada coluna de mês como YYYY-MM-01 uma única vez, antes do melt
+        month_labels = (
+            pd.to_datetime(pd.Index(month_columns).astype(str).str.strip().str[:7], format='%Y-%m')
+            .strftime('%Y-%m-01')
+            .tolist()
+        )
+        
+        id_columns = ['GRUPO_ECONOMICO', 'VARIAVEL', 'SERVICO', 'ARQUIVO_ORIGEM', 'LINHA_ORIGEM']
+        wide = df[id_columns[:-1] + month_columns].set_axis(id_columns[:-1] + month_labels, axis=1)
+        wide['LINHA_ORIGEM'] = df.index
+        
+        # Limpa grupo e variável e mapeia variável para código
+        wide['GRUPO_ECONOMICO'] = self._clean_text(wide['GRUPO_ECONOMICO'])
+        wide['VARIAVEL'] = self._clean_text(wide['VARIAVEL'])
+        wide['VARIAVEL'] = (
+            wide['VARIAVEL']
+            .map(ODSExtractor.VARIABLE_MAPPING)
+            .fillna(wide['VARIAVEL'])
+        )
+        
+        # Descarta linhas sem grupo ou variável
+        wide = wide[(wide['GRUPO_ECONOMICO'] != '') & (wide['VARIAVEL'] != '')]
+        
+        # Converte o formato largo (uma coluna por mês) em uma linha por célula
+        long = wide.melt(
+            id_vars=id_columns,
+            value_vars=month_labels,
+            var_name='ANO_MES',
+            value_name='VALOR'
+        )
+        
+        # Converte valores para float; '-', vazios e inválidos viram NaN.
+        # Só as células que não são numéricas passam pela normalização de
+        # texto ('90,1%' -> 90.1), evitando converter todo o bloco para str
+        valores = pd.to_numeric(long['VALOR'], errors='coerce')
+        pendentes = valores.isna() & long['VALOR'].notna()
+        if pendentes.any():
+            textos = (
+                long.loc[pendentes, 'VALOR']
+                .astype(str)
+                .str.strip()
+                .str.replace(',', '.', regex=False)
+                .str.replace('%', '', regex=False)
+            )
+            valores[pendentes] = pd.to_numeric(textos, errors='coerce')
+        long['VALOR'] = valores
+        long = long.dropna(subset=['VALOR'])
+        
+        long['HASH_REGISTRO'] = self._generate_hashes(long)
+        
+        columns = [
+            'ANO_MES', 'GRUPO_ECONOMICO', 'SERVICO', 'VARIAVEL',
+            'VALOR', 'ARQUIVO_ORIGEM', 'LINHA_ORIGEM', 'HASH_REGISTRO'
+        ]
+        records = long[columns].set_axis(self.OUTPUT_COLUMNS, axis=1).reset_index(drop=True)
         
         self.logger.info(f"Transformados {len(records)} registros")
         return records
     
-    def _is_month_column(self, col: str) -> bool:
-        """Verifica se a coluna é um mês no formato YYYY-MM."""
-        try:
-            col_str = str(col).strip()
-            
-            # Verifica formato YYYY-MM
-            if len(col_str) == 7 and col_str[4] == '-':
-                year, month = col_str.split('-')
-                return 2000 <= int(year) <= 2030 and 1 <= int(month) <= 12
+    def _generate_hashes(self, long: pd.DataFrame) -> List[str]:
+        """Gera o hash BLAKE2b de deduplicação para todas as linhas de uma vez.
+        
+        Args:
+            long: DataFrame no formato longo já limpo
             
-            # Verifica se é um Timestamp pandas
-            if hasattr(col, 'year') and hasattr(col, 'month'):
-                return True
-                
-            return False
-        except:
-            return False
+        Returns:
+            List[str]: Hash BLAKE2b de 128 bits (hex) de cada linha, na ordem do DataFrame
+        """
+        content = (
+            long['ANO_MES'].to_numpy(dtype=object) + '|'
+            + long['GRUPO_ECONOMICO'].to_numpy(dtype=object) + '|'
+            + long['SERVICO'].to_numpy(dtype=object) + '|'
+            + long['VARIAVEL'].to_numpy(dtype=object) + '|'
+            + long['VALOR'].astype(str).to_numpy(dtype=object)
+        )
+        # O hash é só chave de deduplicação; BLAKE2b é mais rápido que MD5 e
+        # com digest de 16 bytes mantém os mesmos 32 caracteres hex
+        blake2b = hashlib.blake2b
+        return [blake2b(c.encode(), digest_size=16).hexdigest() for c in content]
     
-    def _clean_text(self, text: Any) -> str:
-        """Limpa e padroniza texto."""
-        if pd.isna(text):
-            return ""
-        
-        text = str(text).strip()
-        text = ' '.join(text.split())
-        
-        # Padroniza grupos econômicos conhecidos
-        group_mapping = {
-            'ALGAR TELECOM S/A': 'ALGAR',
-            'CLARO S.A.': 'CLARO',
-            'TELEFÔNICA BRASIL S.A.': 'VIVO',
-            'TIM S.A.': 'TIM',
-            'OI S.A.': 'OI',
-            'NET SERVIÇOS DE COMUNICAÇÃO S.A.': 'NET',
-            'SKY BRASIL SERVIÇOS LTDA.': 'SKY',
-            'EMPRESA BRASILEIRA DE TELECOMUNICAÇÕES S.A. - EMBRATEL': 'EMBRATEL',
-            'NEXTEL TELECOMUNICAÇÕES LTDA.': 'NEXTEL',
-            'SERCOMTEL S.A. TELECOMUNICAÇÕES': 'SERCOMTEL'
-        }
+    def _clean_text(self, series: pd.Series) -> pd.Series:
+        """Limpa e padroniza os textos de uma coluna inteira.
         
-        return group_mapping.get(text, text)
-    
-    def _parse_value(self, value: Any) -> Optional[float]:
-        """Converte valor para float."""
-        try:
-            if isinstance(value, str):
-                value = value.replace(',', '.').replace('%', '')
-            return float(value)
-        except:
-            return None
+        Remove espaços nas bordas, colapsa espaços internos, converte
+        valores nulos em string vazia e padroniza grupos econômicos
+        conhecidos via GROUP_MAPPING.
+        
+        Em colunas category, a limpeza roda uma vez por categoria e o
+        resultado é expandido pelos códigos (código -1, nulo, vira '').
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = self._clean_text(pd.Series(series.cat.categories, dtype=object))
+            cleaned = np.append(categories.to_numpy(dtype=object), '')
+            return pd.Series(cleaned[series.cat.codes.to_numpy()], index=series.index)
+        
+        text = series.astype(str).str.split().str.join(' ')
+        text = text.where(series.notna(), '')
+        return text.map(self.GROUP_MAPPING).fillna(text)
 
 
 class PostgreSQLLoader:
@@ -435,6 +437,30 @@ class PostgreSQLLoader:
     Realiza a carga dos dados transformados no banco de dados.
     """
     
+    # Nomes de meses em português
+    MONTH_NAMES = {
+        1: 'Janeiro', 2: 'Fevereiro', 3: 'Março', 4: 'Abril',
+        5: 'Maio', 6: 'Junho', 7: 'Julho', 8: 'Agosto',
+        9: 'Setembro', 10: 'Outubro', 11: 'Novembro', 12: 'Dezembro'
+    }
+    
+    # Índices secundários de ida.fact_ida (as mesmas definições de
+    # schema_star.sql), removidos durante a sessão de carga
+    FACT_SECONDARY_INDEXES = {
+        'idx_fact_ida_metrica_principal': (
+            "CREATE INDEX IF NOT EXISTS idx_fact_ida_metrica_principal "
+            "ON ida.fact_ida(variavel_key, tempo_key, grupo_key)"
+        ),
+        'idx_fact_ida_tempo_grupo': (
+            "CREATE INDEX IF NOT EXISTS idx_fact_ida_tempo_grupo "
+            "ON ida.fact_ida(tempo_key, grupo_key)"
+        ),
+        'idx_fact_ida_arquivo': (
+            "CREATE INDEX IF NOT EXISTS idx_fact_ida_arquivo "
+            "ON ida.fact_ida(arquivo_origem)"
+        )
+    }
+    
     def __init__(self, config: ETLConfig):
         """Inicializa o carregador.
         
@@ -443,50 +469,111 @@ class PostgreSQLLoader:
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._connection_pool = None
+        self._connection = None
     
     def __enter__(self):
-        """Inicializa pool de conexões."""
-        self._connection_pool = SimpleConnectionPool(
-            1, 5,
-            self.config.db_connection_string
-        )
+        """Abre a conexão usada por todas as cargas da sessão.
+        
+        O ETL tem um único escritor, então uma conexão persistente
+        evita refazer autenticação e setup de sessão a cada carga.
+        """
+        self._connection = psycopg2.connect(self.config.db_connection_string)
+        self._connection.autocommit = False
+        try:
+            self._drop_secondary_indexes()
+        except Exception:
+            self._connection.close()
+            self._connection = None
+            raise
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Fecha pool de conexões."""
-        if self._connection_pool:
-            self._connection_pool.closeall()
+        """Recria os índices secundários da fato e fecha a conexão.
+        
+        Uma falha ao recriar os índices é registrada sem substituir a
+        exceção que estiver em curso; a próxima sessão de carga os recria.
+        """
+        if self._connection:
+            try:
+                self._restore_secondary_indexes()
+            except Exception as e:
+                self.logger.error(
+                    f"Erro ao recriar índices de ida.fact_ida: {str(e)} "
+                    f"(serão recriados na próxima carga)"
+                )
+                if exc_type is None:
+                    raise
+            finally:
+                self._connection.close()
+                self._connection = None
     
-    def load(self, records: List[DataRecord]) -> int:
+    def _drop_secondary_indexes(self) -> None:
+        """Remove os índices secundários de ida.fact_ida antes das cargas.
+        
+        Os índices de FACT_SECONDARY_INDEXES não são usados pela carga e
+        seriam mantidos a cada linha inserida; são recriados uma única vez
+        ao final da sessão. A chave primária e as constraints únicas (a de
+        hash_registro é usada pelo ON CONFLICT) são preservadas. Índices
+        já ausentes indicam uma sessão anterior interrompida e são
+        recriados ao final desta.
+        """
+        conn = self._connection
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE schemaname = 'ida' AND tablename = 'fact_ida' "
+                "AND indexname = ANY(%s)",
+                (list(self.FACT_SECONDARY_INDEXES),)
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            missing = sorted(set(self.FACT_SECONDARY_INDEXES) - existing)
+            if missing:
+                self.logger.warning(f"Índices ausentes em ida.fact_ida: {', '.join(missing)}")
+            
+            cursor.execute(
+                "DROP INDEX IF EXISTS "
+                + ", ".join(f"ida.{name}" for name in self.FACT_SECONDARY_INDEXES)
+            )
+        conn.commit()
+        self.logger.info(f"Índices removidos durante a carga: {len(existing)}")
+    
+    def _restore_secondary_indexes(self) -> None:
+        """Recria os índices de FACT_SECONDARY_INDEXES.
+        
+        Usa CREATE INDEX simples, e não CONCURRENTLY: o ETL é o único
+        escritor, e a construção concorrente faz duas varreduras da tabela
+        e não pode rodar dentro de uma transação.
+        """
+        conn = self._connection
+        conn.rollback()
+        with conn.cursor() as cursor:
+            cursor.execute("SET LOCAL maintenance_work_mem = '256MB'")
+            for create_index in self.FACT_SECONDARY_INDEXES.values():
+                cursor.execute(create_index)
+        conn.commit()
+        self.logger.info(f"Índices recriados após a carga: {len(self.FACT_SECONDARY_INDEXES)}")
+    
+    def load(self, records: pd.DataFrame) -> int:
         """Carrega registros no banco de dados.
         
         Args:
-            records: Lista de registros a serem carregados
+            records: DataFrame com as colunas de DataTransformer.OUTPUT_COLUMNS
             
         Returns:
             int: Número de registros inseridos
         """
-        if not records:
+        if records.empty:
             self.logger.warning("Nenhum registro para carregar")
             return 0
         
-        conn = self._connection_pool.getconn()
+        conn = self._connection
         try:
             with conn.cursor() as cursor:
+                # A carga pode ser refeita (ON CONFLICT DO NOTHING), então o
+                # commit não precisa esperar o flush do WAL em disco
+                cursor.execute("SET LOCAL synchronous_commit = off")
                 self._ensure_dimensions(cursor, records)
-                inserted = 0
-                
-                # Processa em batches
-                for i in range(0, len(records), self.config.batch_size):
-                    batch = records[i:i + self.config.batch_size]
-                    batch_inserted = self._insert_batch(cursor, batch)
-                    inserted += batch_inserted
-                    
-                    self.logger.info(
-                        f"Batch {i//self.config.batch_size + 1}: "
-                        f"{batch_inserted}/{len(batch)} registros inseridos"
-                    )
+                inserted = self._copy_load(cursor, records)
                 
                 conn.commit()
                 self.logger.info(f"Total de registros inseridos: {inserted}")
@@ -496,12 +583,52 @@ class PostgreSQLLoader:
             conn.rollback()
             self.logger.error(f"Erro ao carregar dados: {str(e)}")
             raise
-        finally:
-            self._connection_pool.putconn(conn)
     
-    def _insert_batch(self, cursor, batch: List[DataRecord]) -> int:
-        """Insere um batch de registros."""
-        insert_query = """
+    def _copy_load(self, cursor, records: pd.DataFrame) -> int:
+        """Carrega os registros via COPY em uma tabela de staging.
+
+        As chaves das dimensões são resolvidas no cliente; o DataFrame
+        resultante é serializado em CSV direto para o COPY FROM STDIN de
+        uma tabela temporária (que não gera WAL) e inserido na fato com um
+        único INSERT ... SELECT, sem JOINs por linha no servidor, de modo
+        que o custo de log da carga fica restrito a esse INSERT.
+        """
+        keys = self._fetch_dimension_keys(cursor, records)
+        fact = pd.DataFrame({
+            'tempo_key': records['ano_mes'].map(keys['tempo']),
+            'grupo_key': records['grupo_economico'].map(keys['grupo']),
+            'servico_key': records['servico'].map(keys['servico']),
+            'variavel_key': records['variavel'].map(keys['variavel']),
+            'valor': records['valor'],
+            'arquivo_origem': records['arquivo_origem'],
+            'linha_origem': records['linha_origem'],
+            'hash_registro': records['hash_registro']
+        })
+
+        key_columns = ['tempo_key', 'grupo_key', 'servico_key', 'variavel_key']
+        fact = fact.dropna(subset=key_columns)
+        fact[key_columns] = fact[key_columns].astype('int64')
+
+        cursor.execute("""
+            CREATE TEMP TABLE stg_fact (
+                tempo_key       integer,
+                grupo_key       integer,
+                servico_key     integer,
+                variavel_key    integer,
+                valor           numeric,
+                arquivo_origem  text,
+                linha_origem    integer,
+                hash_registro   text
+            ) ON COMMIT DROP
+        """)
+
+        buffer = StringIO()
+        fact.to_csv(buffer, header=False, index=False)
+        buffer.seek(0)
+
+        cursor.copy_expert("COPY stg_fact FROM STDIN WITH (FORMAT csv)", buffer)
+
+        cursor.execute("""
             INSERT INTO ida.fact_ida (
                 tempo_key,
                 grupo_key,
@@ -513,111 +640,150 @@ class PostgreSQLLoader:
                 hash_registro
             )
             SELECT
-                t.tempo_key,
-                g.grupo_key,
-                s.servico_key,
-                v.variavel_key,
-                %(valor)s::numeric,
-                %(arquivo_origem)s,
-                %(linha_origem)s,
-                %(hash_registro)s
-            FROM
-                ida.dim_tempo t,
-                ida.dim_grupo_economico g,
-                ida.dim_servico s,
-                ida.dim_variavel v
-            WHERE
-                t.ano_mes = %(ano_mes)s::date
-                AND g.grupo_codigo = %(grupo_economico)s
-                AND s.servico_codigo = %(servico)s
-                AND v.variavel_codigo = %(variavel)s
+                tempo_key,
+                grupo_key,
+                servico_key,
+                variavel_key,
+                valor,
+                arquivo_origem,
+                linha_origem,
+                hash_registro
+            FROM stg_fact
             ON CONFLICT (hash_registro) DO NOTHING
-        """
-        
-        inserted = 0
-        for record in batch:
-            params = {
-                'ano_mes': record.ano_mes,
-                'grupo_economico': record.grupo_economico,
-                'servico': record.servico,
-                'variavel': record.variavel,
-                'valor': record.valor,
-                'arquivo_origem': record.arquivo_origem,
-                'linha_origem': record.linha_origem,
-                'hash_registro': record.generate_hash()
-            }
-            cursor.execute(insert_query, params)
-            if cursor.rowcount == 0:
-                self.logger.warning(f"Ignorado registro sem correspondência: {params}")
-            inserted += cursor.rowcount
-        
+        """)
+        inserted = cursor.rowcount
+
+        ignored = len(records) - inserted
+        if ignored:
+            self.logger.warning(f"Ignorados {ignored} registros sem correspondência ou duplicados")
+
         return inserted
 
-    def _ensure_dimensions(self, cursor, records: List[DataRecord]) -> None:
-        """Garante que todas as entradas de dimensão existam"""
-        from datetime import datetime
-        
-        # Nomes de meses em português
-        month_names = {
-            1: 'Janeiro', 2: 'Fevereiro', 3: 'Março', 4: 'Abril',
-            5: 'Maio', 6: 'Junho', 7: 'Julho', 8: 'Agosto',
-            9: 'Setembro', 10: 'Outubro', 11: 'Novembro', 12: 'Dezembro'
+    def _fetch_dimension_keys(self, cursor, records: pd.DataFrame) -> Dict[str, Dict[str, int]]:
+        """Busca as chaves substitutas das dimensões usadas pelos registros.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Mapeamento chave natural -> chave
+            substituta para 'tempo', 'grupo', 'servico' e 'variavel'
+        """
+        queries = {
+            'tempo': (
+                "SELECT to_char(ano_mes, 'YYYY-MM-DD'), tempo_key FROM ida.dim_tempo "
+                "WHERE ano_mes = ANY(%s::date[])",
+                'ano_mes'
+            ),
+            'grupo': (
+                "SELECT grupo_codigo, grupo_key FROM ida.dim_grupo_economico "
+                "WHERE grupo_codigo = ANY(%s)",
+                'grupo_economico'
+            ),
+            'servico': (
+                "SELECT servico_codigo, servico_key FROM ida.dim_servico "
+                "WHERE servico_codigo = ANY(%s)",
+                'servico'
+            ),
+            'variavel': (
+                "SELECT variavel_codigo, variavel_key FROM ida.dim_variavel "
+                "WHERE variavel_codigo = ANY(%s)",
+                'variavel'
+            )
         }
-        
+
+        keys = {}
+        for dimension, (query, column) in queries.items():
+            cursor.execute(query, (records[column].unique().tolist(),))
+            keys[dimension] = dict(cursor.fetchall())
+        return keys
+
+    def _ensure_dimensions(self, cursor, records: pd.DataFrame) -> None:
+        """Garante que todas as entradas de dimensão existam.
+
+        Cada dimensão é populada com um único INSERT multi-linha.
+        """
         # Coleta valores únicos
-        tempos = set(r.ano_mes for r in records)
-        grupos = set(r.grupo_economico for r in records)
-        servicos = set(r.servico for r in records)
-        variaveis = set(r.variavel for r in records)
-
-        # Insere dim_tempo
-        for ano_mes in tempos:
-            dt = datetime.strptime(ano_mes, '%Y-%m-%d')
-            year, month = dt.year, dt.month
-            mes_nome = month_names[month]
-            trimestre = (month - 1) // 3 + 1
-            semestre = (month - 1) // 6 + 1
-            cursor.execute(
-                """
-                INSERT INTO ida.dim_tempo (ano_mes, ano, mes, mes_nome, trimestre, semestre)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (ano_mes) DO NOTHING
-                """,
-                (ano_mes, year, month, mes_nome, trimestre, semestre)
-            )
+        anos_mes = records['ano_mes'].drop_duplicates()
+        grupos = records['grupo_economico'].unique()
+        servicos = records['servico'].unique()
+        variaveis = records['variavel'].unique()
+
+        # Insere dim_tempo, com os atributos de calendário calculados de
+        # uma vez para todos os meses (tolist converte para tipos Python,
+        # que o psycopg2 sabe adaptar)
+        tempos = pd.to_datetime(anos_mes, format='%Y-%m-%d')
+        meses = tempos.dt.month
+        tempo_rows = list(zip(
+            anos_mes.tolist(),
+            tempos.dt.year.tolist(),
+            meses.tolist(),
+            meses.map(self.MONTH_NAMES).tolist(),
+            tempos.dt.quarter.tolist(),
+            ((meses - 1) // 6 + 1).tolist()
+        ))
+        execute_values(
+            cursor,
+            """
+            INSERT INTO ida.dim_tempo (ano_mes, ano, mes, mes_nome, trimestre, semestre)
+            VALUES %s
+            ON CONFLICT (ano_mes) DO NOTHING
+            """,
+            tempo_rows
+        )
 
         # Insere dim_grupo_economico
-        for grp in grupos:
-            cursor.execute(
-                """
-                INSERT INTO ida.dim_grupo_economico (grupo_codigo, grupo_nome, grupo_normalizado)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (grupo_codigo) DO NOTHING
-                """,
-                (grp, grp, grp)
-            )
+        execute_values(
+            cursor,
+            """
+            INSERT INTO ida.dim_grupo_economico (grupo_codigo, grupo_nome, grupo_normalizado)
+            VALUES %s
+            ON CONFLICT (grupo_codigo) DO NOTHING
+            """,
+            [(grp, grp, grp) for grp in grupos]
+        )
 
         # Insere dim_servico
-        for svc in servicos:
-            cursor.execute(
-                """
-                INSERT INTO ida.dim_servico (servico_codigo, servico_nome, servico_descricao)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (servico_codigo) DO NOTHING
-                """,
-                (svc, svc, svc)
-            )
+        execute_values(
+            cursor,
+            """
+            INSERT INTO ida.dim_servico (servico_codigo, servico_nome, servico_descricao)
+            VALUES %s
+            ON CONFLICT (servico_codigo) DO NOTHING
+            """,
+            [(svc, svc, svc) for svc in servicos]
+        )
 
         # Insere dim_variavel
-        for var in variaveis:
-            cursor.execute(
-                """
-                INSERT INTO ida.dim_variavel (variavel_codigo, variavel_nome)
-                VALUES (%s, %s)
-                ON CONFLICT (variavel_codigo) DO NOTHING
-                """,
-                (var, var)
-            )
+        execute_values(
+            cursor,
+            """
+            INSERT INTO ida.dim_variavel (variavel_codigo, variavel_nome)
+            VALUES %s
+            ON CONFLICT (variavel_codigo) DO NOTHING
+            """,
+            [(var, var) for var in variaveis]
+        )
+
+
+def processar_recurso(
+    conteudo: bytes,
+    metadata: Dict[str, Any],
+    config: ETLConfig
+) -> Tuple[int, pd.DataFrame]:
+    """Extrai e transforma o conteúdo de um arquivo ODS.
+    
+    Função de nível de módulo para poder ser executada em um
+    ProcessPoolExecutor.
+    
+    Args:
+        conteudo: Bytes do arquivo ODS
+        metadata: Dicionário com 'filename', 'servico'
+        config: Configuração do ETL
+        
+    Returns:
+        Tuple[int, pd.DataFrame]: Linhas extraídas e registros normalizados
+    """
+    df = ODSExtractor(config).extract(BytesIO(conteudo), metadata)
+    records = DataTransformer(config).transform(df)
+    return len(df), records
 
 
 class ETLPipeline:
@@ -655,6 +821,7 @@ class ETLPipeline:
     CONJUNTO_IDA_ID = "63a9c9f6-9991-48b4-a072-ce22765652e6"
     SERVICOS_ALVO = ["SMP", "STFC", "SCM"]
     ANOS_ALVO = [2017, 2018, 2019]
+    MAX_DOWNLOAD_WORKERS = 8
     
     def __init__(self, config: Optional[ETLConfig] = None):
         """Inicializa o pipeline.
@@ -665,8 +832,21 @@ class ETLPipeline:
         self.config = config or ETLConfig()
         self.logger = logging.getLogger(self.__class__.__name__)
         self.headers = {"chave-api-dados-abertos": self.config.api_key}
-        self.extractor = ODSExtractor(self.config)
-        self.transformer = DataTransformer(self.config)
+        
+        # Sessão HTTP compartilhada: reaproveita conexões TCP/TLS entre as
+        # chamadas e refaz requisições em falhas transitórias do servidor
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=self.config.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.loader = PostgreSQLLoader(self.config)
     
     def _requisicao_api(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
@@ -674,7 +854,7 @@ class ETLPipeline:
         url = f"{self.BASE_URL}/{endpoint}"
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -711,19 +891,29 @@ class ETLPipeline:
             servico=servico
         )
     
-    def _baixar_arquivo_memoria(self, recurso: RecursoIDA) -> Optional[BytesIO]:
-        """Baixa arquivo diretamente para memória."""
+    def _baixar_arquivo_memoria(self, recurso: RecursoIDA) -> Optional[bytes]:
+        """Baixa arquivo diretamente para memória.
+        
+        Returns:
+            Optional[bytes]: Conteúdo do arquivo, ou None em caso de falha
+        """
         if not recurso.url:
             self.logger.warning(f"URL vazia para recurso: {recurso.titulo}")
             return None
         
         try:
             self.logger.info(f"Baixando para memória: {recurso.titulo}")
-            response = requests.get(recurso.url, timeout=60)
-            response.raise_for_status()
+            with self.session.get(recurso.url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                
+                # Copia o corpo em blocos direto para o buffer em memória,
+                # sem manter uma segunda cópia em response.content
+                response.raw.decode_content = True
+                buffer = BytesIO()
+                shutil.copyfileobj(response.raw, buffer, length=1 << 20)
             
-            # Retorna conteúdo em memória
-            return BytesIO(response.content)
+            # getvalue ajusta o buffer ao tamanho final e o devolve sem cópia
+            return buffer.getvalue()
             
         except Exception as e:
             self.logger.error(f"Erro ao baixar {recurso.titulo}: {e}")
@@ -772,50 +962,72 @@ class ETLPipeline:
         
         self.logger.info(f"Total de recursos para processar: {len(recursos_filtrados)}")
         
-        # Processa cada recurso
-        self.logger.info("ETAPA 2: Processando recursos")
-        all_records = []
+        # Processa os recursos em paralelo: downloads em threads e
+        # extração/transformação em processos separados (contexto 'spawn',
+        # portável entre plataformas); cada arquivo é carregado assim que
+        # termina de ser processado, na mesma conexão com o banco
+        self.logger.info("ETAPA 2: Processando e carregando recursos")
+        max_process_workers = max(1, min(len(recursos_filtrados), os.cpu_count() or 1))
         
-        with self.loader:
-            for recurso in recursos_filtrados:
-                try:
-                    # Baixa arquivo para memória
-                    file_content = self._baixar_arquivo_memoria(recurso)
-                    if not file_content:
+        with ThreadPoolExecutor(max_workers=self.MAX_DOWNLOAD_WORKERS) as download_pool, \
+                ProcessPoolExecutor(
+                    max_workers=max_process_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                ) as process_pool, \
+                self.loader:
+            downloads = {
+                download_pool.submit(self._baixar_arquivo_memoria, recurso): recurso
+                for recurso in recursos_filtrados
+            }
+            processing = {}
+            
+            # Downloads e processamentos são atendidos na ordem em que
+            # terminam; cada future é retirado do seu dicionário ao ser
+            # consumido, então o conteúdo baixado só vive até o fim da
+            # extração e cada DataFrame só até ser carregado
+            pending = set(downloads)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in downloads:
+                        recurso = downloads.pop(future)
+                        conteudo = future.result()
+                        if not conteudo:
+                            continue
+                        
+                        metadata = {
+                            'filename': f"{recurso.servico}_{recurso.ano}.ods",
+                            'servico': recurso.servico
+                        }
+                        submitted = process_pool.submit(
+                            processar_recurso, conteudo, metadata, self.config
+                        )
+                        processing[submitted] = recurso
+                        pending.add(submitted)
                         continue
                     
-                    # Extrai dados
-                    metadata = {
-                        'filename': f"{recurso.servico}_{recurso.ano}.ods",
-                        'servico': recurso.servico
-                    }
-                    df = self.extractor.extract(file_content, metadata)
-                    stats['registros_extraidos'] += len(df)
-                    
-                    # Transforma dados
-                    records = self.transformer.transform(df)
-                    stats['registros_transformados'] += len(records)
-                    all_records.extend(records)
-                    
-                    # Carrega no banco em lotes para não acumular muita memória
-                    if len(all_records) >= self.config.batch_size * 5:
-                        loaded = self.loader.load(all_records)
+                    recurso = processing.pop(future)
+                    try:
+                        extraidos, records = future.result()
+                        stats['registros_extraidos'] += extraidos
+                        stats['registros_transformados'] += len(records)
+                        
+                        loaded = self.loader.load(records)
                         stats['registros_carregados'] += loaded
-                        all_records = []  # Limpa lista
-                    
-                    stats['recursos_processados'] += 1
-                    self.logger.info(f"Recurso {recurso.servico} {recurso.ano}: {len(records)} registros")
-                    
-                except Exception as e:
-                    error_msg = f"Erro ao processar {recurso.titulo}: {str(e)}"
-                    self.logger.error(error_msg)
-                    stats['erros'].append(error_msg)
-            
-            # Carrega registros restantes
-            if all_records:
-                self.logger.info(f"ETAPA 3: Carregando {len(all_records)} registros restantes")
-                loaded = self.loader.load(all_records)
-                stats['registros_carregados'] += loaded
+                        
+                        stats['recursos_processados'] += 1
+                        self.logger.info(
+                            f"Recurso {recurso.servico} {recurso.ano}: "
+                            f"{len(records)} registros, {loaded} carregados"
+                        )
+                        
+                    except Exception as e:
+                        error_msg = f"Erro ao processar {recurso.titulo}: {str(e)}"
+                        self.logger.error(error_msg)
+                        stats['erros'].append(error_msg)
+                
+                # Libera os resultados já consumidos antes de aguardar os próximos
+                done = future = conteudo = records = None
         
         # Finaliza e reporta estatísticas
         end_time = datetime.now()
@@ -7,11 +7,13 @@ Description:
     Fecha conexões ativas em idadatamart, dropa o database, recria-o e
     aplica todas as definições e dados do schema em 'schema_star.sql'.
 
-    O script lê o arquivo SQL, divide os comandos por ponto-e-vírgula (';'),
-    descarta comentários (linhas iniciadas com '--') e metacomandos psql
-    (linhas iniciadas com '\\'), e executa cada comando em sequência.
-    Para cada SQL executado, uma mensagem é impressa; em caso de erro,
-    o comando exato que falhou e o erro são destacados.
+    O script lê o arquivo SQL, remove as linhas de comentário ('--') e os
+    metacomandos psql (linhas iniciadas com '\\') e envia o script inteiro
+    em um único execute, de modo que o servidor processa todos os comandos
+    em um só round trip.
+    Em caso de erro, nada do schema é aplicado: o comando que falhou (quando
+    o servidor informa a posição) e o erro são destacados e o script
+    encerra com código de saída 1.
 
 Example:
     $ python init_db.py
@@ -20,26 +22,64 @@ Raises:
     SystemExit: Se houver erro na conexão ou na execução dos comandos.
 """
 
+import logging
+import logging.handlers
+import re
 import sys
-from urllib.parse import urlparse, urlunparse
+from typing import Optional
 import psycopg2
 from psycopg2 import sql
 from etl.etl_ida import ETLConfig
 
+# Logger próprio do init_db, com as mensagens acumuladas em memória e
+# escritas no stdout em lote (no flush final ou ao registrar um erro), em
+# vez de uma escrita por mensagem
+logger = logging.getLogger('init_db')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_buffer_handler = logging.handlers.MemoryHandler(1024, target=_stdout_handler)
+logger.addHandler(_buffer_handler)
+
+# Linhas de comentário ('--') e metacomandos psql ('\\'), removidas do
+# script em uma única varredura antes do envio
+_FILTER = re.compile(rb'(?m)^[ \t]*(?:--[^\n]*|\\[^\n]*)$')
+
+def _comando_na_posicao(sql_text: str, posicao: Optional[str]) -> str:
+    """
+    Retorna o comando SQL que contém a posição de erro informada pelo servidor.
+
+    Args:
+        sql_text: Script SQL enviado ao servidor.
+        posicao: Posição (1-based, em caracteres) reportada em
+            psycopg2.Error.diag.statement_position, ou None.
+
+    Returns:
+        str: O comando delimitado por ';' que contém a posição, ou o aviso
+        '<posição não informada>' quando o servidor não a reporta.
+    """
+    if not posicao:
+        return "<posição não informada>"
+    idx = int(posicao) - 1
+    inicio = sql_text.rfind(";", 0, idx) + 1
+    fim = sql_text.find(";", idx)
+    return sql_text[inicio:fim if fim != -1 else len(sql_text)].strip()
+
 def main():
     """
     Executa o processo de criação do database e aplicação do schema a partir de 'schema_star.sql'.
 
     Fluxo:
-        1. Conecta ao banco 'postgres' e encerra conexões ativas no 'idadatamart'.
-        2. Dropa e recria o database 'idadatamart'.
+        1. Conecta ao banco 'postgres'.
+        2. Dropa (encerrando conexões ativas) e recria o database 'idadatamart'.
         3. Reconnecta ao 'idadatamart' via psycopg2.
-        4. Abre 'schema_star.sql', parseia o conteúdo:
-           - Divide por ';' para separar comandos.
-           - Remove linhas vazias, comentários ('--') e metacomandos psql ('\\').
-        5. Executa cada comando em sequência, imprimindo na saída:
-           - o SQL executado.
-           - em caso de falha, exibe 'SQL FALHOU:' seguido do comando e do erro.
+        4. Abre 'schema_star.sql' e remove comentários ('--') e metacomandos psql ('\\').
+        5. Executa o script inteiro em um único comando e transação:
+           - em caso de falha, desfaz a transação, registra 'SQL FALHOU:'
+             seguido do comando e do erro e encerra com código 1.
     Args:
         None
 
@@ -50,64 +90,63 @@ def main():
         SystemExit: Se houver erro na conexão ou na execução dos comandos.
     """
     config = ETLConfig()
-    # Parsear DSN original
-    parsed = urlparse(config.db_connection_string)
-    # Conectar ao banco 'postgres' para criar o database
-    default_netloc = parsed.netloc
-    postgres_path = '/postgres'
-    dsn_postgres = urlunparse(parsed._replace(path=postgres_path))
     try:
-        conn = psycopg2.connect(dsn_postgres)
+        # Conectar ao banco 'postgres' para criar o database
+        conn = psycopg2.connect(config.db_connection_string, dbname='postgres')
         conn.autocommit = True
         cur = conn.cursor()
-        print("Encerrando conexões ativas em idadatamart...")
-        cur.execute("""
-            SELECT pg_terminate_backend(pid)
-            FROM pg_stat_activity
-            WHERE datname = 'idadatamart'
-              AND pid <> pg_backend_pid();
-        """)
-        print("Dropando database idadatamart...")
-        cur.execute("DROP DATABASE IF EXISTS idadatamart;")
-        print("Criando database idadatamart...")
+        # WITH (FORCE) encerra as conexões ativas no próprio DROP; DROP/CREATE
+        # DATABASE não rodam em bloco de transação, então não podem ir juntos
+        # em uma única string multi-comando.
+        logger.info("Encerrando conexões e dropando database idadatamart...")
+        cur.execute("DROP DATABASE IF EXISTS idadatamart WITH (FORCE);")
+        logger.info("Criando database idadatamart...")
         cur.execute("CREATE DATABASE idadatamart;")
-        print("Database recriado.")
+        logger.info("Database recriado.")
         cur.close()
         conn.close()
     except Exception as e:
-        print(f"Erro criando/recriando database: {e}")
+        logger.error(f"Erro criando/recriando database: {e}")
         sys.exit(1)
 
     # Conectar ao idadatamart
     try:
         conn2 = psycopg2.connect(config.db_connection_string)
-        conn2.autocommit = True
+        conn2.autocommit = False
+        conn2.set_client_encoding("UTF8")
         cur2 = conn2.cursor()
     except Exception as e:
-        print(f"Erro conectando ao idadatamart: {e}")
+        logger.error(f"Erro conectando ao idadatamart: {e}")
         sys.exit(1)
 
-    # Ler e executar comandos do schema script
-    print("Executando schema_star.sql...")
-    with open("schema_star.sql", "r", encoding="utf-8") as f:
-        sql_text = f.read()
-    # Remover linhas de conexão psql e comentários
-    commands = []
-    for part in sql_text.split(";"):
-        cmd = part.strip()
-        if not cmd or cmd.startswith("--") or cmd.startswith("\\"):
-            continue
-        commands.append(cmd)
-
-    # Executar cada comando
-    for cmd in commands:
-        try:
-            cur2.execute(cmd)
-        except Exception as e:
-            print(f"SQL FALHOU: {cmd}\nErro: {e}")
+    # Ler o schema script como bytes UTF-8: o psycopg2 aceita a query em
+    # bytes, então o texto só é decodificado se for preciso reportar um erro
+    logger.info("Executando schema_star.sql...")
+    with open("schema_star.sql", "rb", buffering=1 << 20) as f:
+        sql_bytes = f.read()
+    # Remover linhas de comentário e metacomandos psql
+    sql_bytes = _FILTER.sub(b'', sql_bytes)
+
+    # Executar o script inteiro em um único round trip e uma única transação
+    # (DDL é transacional no PostgreSQL, então o schema é aplicado por inteiro
+    # ou não é aplicado)
+    try:
+        cur2.execute(
+            "SET LOCAL synchronous_commit = off; "
+            "SET LOCAL maintenance_work_mem = '1GB'"
+        )
+        cur2.execute(sql_bytes)
+        conn2.commit()
+    except psycopg2.Error as e:
+        conn2.rollback()
+        cmd = _comando_na_posicao(sql_bytes.decode("utf-8"), e.diag.statement_position)
+        logger.error(f"SQL FALHOU: {cmd}\nErro: {e}")
+        conn2.close()
+        sys.exit(1)
     cur2.close()
     conn2.close()
-    print("Inicialização concluída com sucesso.")
+    logger.info("Inicialização concluída com sucesso.")
+    _buffer_handler.flush()
 
 if __name__ == "__main__":
     main()
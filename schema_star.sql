@@ -1,8 +1,7 @@
 -- IDP: Recriação idempotente do Data Mart IDA
 
--- Drop e recria o banco
-DROP DATABASE IF EXISTS idadatamart;
-CREATE DATABASE idadatamart;
+-- O banco idadatamart é dropado e recriado por init_db.py, que envia este
+-- script em um único execute (onde DROP/CREATE DATABASE não são permitidos)
 \connect idadatamart
 
 -- Drop e recria schema
@@ -25,10 +24,6 @@ CREATE TABLE dim_tempo (
     trimestre   INTEGER NOT NULL CHECK (trimestre BETWEEN 1 AND 4),
     semestre    INTEGER NOT NULL CHECK (semestre BETWEEN 1 AND 2)
 );
-DROP INDEX IF EXISTS idx_dim_tempo_ano_mes;
-DROP INDEX IF EXISTS idx_dim_tempo_ano;
-CREATE UNIQUE INDEX idx_dim_tempo_ano_mes ON dim_tempo(ano_mes);
-CREATE INDEX idx_dim_tempo_ano ON dim_tempo(ano);
 
 -- Dimensão Grupo Econômico
 DROP TABLE IF EXISTS dim_grupo_economico CASCADE;
@@ -39,10 +34,6 @@ CREATE TABLE dim_grupo_economico (
     grupo_normalizado  VARCHAR(50) NOT NULL,
     ativo              BOOLEAN NOT NULL DEFAULT true
 );
-DROP INDEX IF EXISTS idx_grupo_codigo;
-DROP INDEX IF EXISTS idx_grupo_normalizado;
-CREATE UNIQUE INDEX idx_grupo_codigo ON dim_grupo_economico(grupo_codigo);
-CREATE INDEX idx_grupo_normalizado ON dim_grupo_economico(grupo_normalizado);
 
 -- Dimensão Serviço
 DROP TABLE IF EXISTS dim_servico CASCADE;
@@ -53,8 +44,6 @@ CREATE TABLE dim_servico (
     servico_descricao TEXT,
     ativo            BOOLEAN NOT NULL DEFAULT true
 );
-DROP INDEX IF EXISTS idx_servico_codigo;
-CREATE UNIQUE INDEX idx_servico_codigo ON dim_servico(servico_codigo);
 
 -- Dimensão Variável
 DROP TABLE IF EXISTS dim_variavel CASCADE;
@@ -69,10 +58,6 @@ CREATE TABLE dim_variavel (
     is_principal      BOOLEAN NOT NULL DEFAULT false,
     ativo             BOOLEAN NOT NULL DEFAULT true
 );
-DROP INDEX IF EXISTS idx_variavel_codigo;
-DROP INDEX IF EXISTS idx_variavel_principal;
-CREATE UNIQUE INDEX idx_variavel_codigo ON dim_variavel(variavel_codigo);
-CREATE INDEX idx_variavel_principal ON dim_variavel(is_principal);
 
 
 -- FATO
@@ -93,12 +78,6 @@ CREATE TABLE fact_ida (
     CONSTRAINT uk_fact_ida_unique UNIQUE (tempo_key, grupo_key, servico_key, variavel_key),
     CONSTRAINT uk_fact_ida_hash UNIQUE (hash_registro)
 );
-DROP INDEX IF EXISTS idx_fact_ida_metrica_principal;
-DROP INDEX IF EXISTS idx_fact_ida_tempo_grupo;
-DROP INDEX IF EXISTS idx_fact_ida_arquivo;
-CREATE INDEX idx_fact_ida_metrica_principal ON fact_ida(variavel_key, tempo_key, grupo_key);
-CREATE INDEX idx_fact_ida_tempo_grupo ON fact_ida(tempo_key, grupo_key);
-CREATE INDEX idx_fact_ida_arquivo ON fact_ida(arquivo_origem);
 
 
 -- VIEW PRINCIPAL
@@ -165,8 +144,8 @@ ORDER BY m.mes;
 
 -- Documentação da view `vw_taxa_variacao`
 COMMENT ON VIEW ida.vw_taxa_variacao IS
-  'View que apresenta a taxa de variação mensal da Taxa de Respondidas em 5 dias úteis, ' ||
-  'calculada como ((valor atual – valor anterior)/valor anterior)*100, junto com a média ' ||
+  'View que apresenta a taxa de variação mensal da Taxa de Respondidas em 5 dias úteis, '
+  'calculada como ((valor atual – valor anterior)/valor anterior)*100, junto com a média '
   'mensal (taxa_variacao_media) e as diferenças individuais por grupo econômico.';
 COMMENT ON COLUMN ida.vw_taxa_variacao.mes IS
   'Mês de referência no formato YYYY-MM';
@@ -266,3 +245,38 @@ INSERT INTO dim_variavel (variavel_codigo, variavel_nome, unidade_medida, is_pri
 ('TAXA_RESP_5DIAS','Taxa de Respondidas em 5 dias Úteis','percentual',true),
 ('TAXA_RESP_PERIODO','Taxa de Respondidas no Período','percentual',false)
 ON CONFLICT (variavel_codigo) DO NOTHING;
+
+-- ÍNDICES
+-- Criados após a carga inicial para que as linhas semeadas não paguem
+-- manutenção de índice secundário uma a uma; cada índice é construído
+-- em uma única passada ordenada sobre a tabela já populada.
+
+-- Dimensão Tempo
+DROP INDEX IF EXISTS idx_dim_tempo_ano_mes;
+DROP INDEX IF EXISTS idx_dim_tempo_ano;
+CREATE UNIQUE INDEX idx_dim_tempo_ano_mes ON dim_tempo(ano_mes);
+CREATE INDEX idx_dim_tempo_ano ON dim_tempo(ano);
+
+-- Dimensão Grupo Econômico
+DROP INDEX IF EXISTS idx_grupo_codigo;
+DROP INDEX IF EXISTS idx_grupo_normalizado;
+CREATE UNIQUE INDEX idx_grupo_codigo ON dim_grupo_economico(grupo_codigo);
+CREATE INDEX idx_grupo_normalizado ON dim_grupo_economico(grupo_normalizado);
+
+-- Dimensão Serviço
+DROP INDEX IF EXISTS idx_servico_codigo;
+CREATE UNIQUE INDEX idx_servico_codigo ON dim_servico(servico_codigo);
+
+-- Dimensão Variável
+DROP INDEX IF EXISTS idx_variavel_codigo;
+DROP INDEX IF EXISTS idx_variavel_principal;
+CREATE UNIQUE INDEX idx_variavel_codigo ON dim_variavel(variavel_codigo);
+CREATE INDEX idx_variavel_principal ON dim_variavel(is_principal);
+
+-- Fato
+DROP INDEX IF EXISTS idx_fact_ida_metrica_principal;
+DROP INDEX IF EXISTS idx_fact_ida_tempo_grupo;
+DROP INDEX IF EXISTS idx_fact_ida_arquivo;
+CREATE INDEX idx_fact_ida_metrica_principal ON fact_ida(variavel_key, tempo_key, grupo_key);
+CREATE INDEX idx_fact_ida_tempo_grupo ON fact_ida(tempo_key, grupo_key);
+CREATE INDEX idx_fact_ida_arquivo ON fact_ida(arquivo_origem);